@@ -33,8 +33,14 @@ Tests for `ynabinterfaceslib` module.
 
 """
 
+import copy
+import pickle
+from unittest import TestCase
+
 from betamax.fixtures import unittest
 
+from ynabinterfaceslib import Transaction
+
 __author__ = '''Costas Tyfoxylos <costas.tyf@gmail.com>'''
 __docformat__ = '''google'''
 __date__ = '''16-08-2019'''
@@ -63,3 +69,208 @@ class TestYnabinterfaceslib(unittest.BetamaxTestCase):
         This is where you should tear down what you've setup in setUp before. This method is called after every test.
         """
         pass
+
+
+class Payment(Transaction):
+    __slots__ = ()
+    _comparable_attributes = ('amount', 'description')
+
+    @property
+    def amount(self):
+        return self._data.get('amount')
+
+    @property
+    def description(self):
+        return self._data.get('description')
+
+
+class Refund(Payment):
+    __slots__ = ()
+
+
+def get_provider_transaction(module):
+    class Transaction(Payment):  # pylint: disable=redefined-outer-name
+        __module__ = module
+        __slots__ = ()
+    return Transaction
+
+
+class LegacyPayment(Transaction):
+    _comparable_attributes = ('amount',)
+
+    def __init__(self, amount):  # pylint: disable=super-init-not-called
+        self.amount = amount
+
+
+class ForgetfulPayment(Transaction):
+    __slots__ = ()
+
+
+class TestComparable(TestCase):
+
+    def setUp(self):
+        """
+        Test set up
+
+        This is where you can setup things that you use throughout the tests. This method is called before every test.
+        """
+        self.data = {'amount': 10, 'description': 'Groceries'}
+        self.payment = Payment(dict(self.data))
+
+    def test_equal_data_compares_equal(self):
+        """
+        Test equal data
+
+        Instances created from the same data should be equal and deduplicate in a set.
+        """
+        self.assertEqual(self.payment, Payment(dict(self.data)))
+        self.assertEqual(len({self.payment, Payment(dict(self.data))}), 1)
+
+    def test_different_data_compares_unequal(self):
+        """
+        Test different data
+
+        Instances created from different data should not be equal.
+        """
+        self.assertNotEqual(self.payment, Payment({'amount': 11, 'description': 'Groceries'}))
+
+    def test_value_types_are_kept_apart(self):
+        """
+        Test value types
+
+        Values with the same string representation but a different type should not be equal.
+        """
+        first = Payment({'amount': 1, 'description': None})
+        second = Payment({'amount': '1', 'description': 'None'})
+        self.assertNotEqual(first, second)
+
+    def test_hash_is_cached(self):
+        """
+        Test hash caching
+
+        The hash is calculated once, so in place changes of _data are not picked up.
+        """
+        first_hash = hash(self.payment)
+        self.payment._data['amount'] = 20  # pylint: disable=protected-access
+        self.assertEqual(hash(self.payment), first_hash)
+
+    def test_reassigning_data_invalidates_hash(self):
+        """
+        Test hash invalidation
+
+        Reassigning _data should reset the cached hash.
+        """
+        first_hash = hash(self.payment)
+        self.payment._data = {'amount': 20, 'description': 'Groceries'}  # pylint: disable=protected-access
+        self.assertNotEqual(hash(self.payment), first_hash)
+        self.assertEqual(self.payment, Payment({'amount': 20, 'description': 'Groceries'}))
+
+    def test_hash_without_super_init(self):
+        """
+        Test hashing without initialization
+
+        Implementations not calling the parent __init__ should still be hashable.
+        """
+        self.assertEqual(LegacyPayment(10), LegacyPayment(10))
+        self.assertNotEqual(LegacyPayment(10), LegacyPayment(20))
+
+    def test_pickling(self):
+        """
+        Test pickling
+
+        A pickled and restored instance should be equal to the original and keep its hash.
+        """
+        hash(self.payment)
+        restored = pickle.loads(pickle.dumps(self.payment))
+        self.assertEqual(restored, self.payment)
+        self.assertEqual(hash(restored), hash(self.payment))
+
+    def test_copying(self):
+        """
+        Test copying
+
+        Copies should be equal to the original and deep copies should not share their hash with it.
+        """
+        self.assertEqual(copy.copy(self.payment), self.payment)
+        duplicate = copy.deepcopy(self.payment)
+        duplicate._data = {'amount': 20, 'description': 'Groceries'}  # pylint: disable=protected-access
+        self.assertNotEqual(duplicate, self.payment)
+        self.assertEqual(self.payment.amount, 10)
+
+    def test_missing_comparable_attributes_raises(self):
+        """
+        Test missing comparable attributes
+
+        Hashing or comparing an implementation without _comparable_attributes should raise.
+        """
+        first = ForgetfulPayment({'amount': 1})
+        second = ForgetfulPayment({'amount': 2})
+        with self.assertRaises(TypeError):
+            hash(first)
+        with self.assertRaises(TypeError):
+            _ = first == second
+
+    def test_invalid_comparable_attributes_raises(self):
+        """
+        Test invalid comparable attributes
+
+        Declaring _comparable_attributes as a property or an empty tuple should raise on class creation.
+        """
+        with self.assertRaises(TypeError):
+            class PropertyPayment(Transaction):  # pylint: disable=unused-variable
+                @property
+                def _comparable_attributes(self):
+                    return ['amount']
+        with self.assertRaises(TypeError):
+            class EmptyPayment(Transaction):  # pylint: disable=unused-variable
+                _comparable_attributes = ()
+
+    def test_comparable_data(self):
+        """
+        Test comparable data
+
+        The comparable data should be a plain dict of the comparable attributes in declaration order.
+        """
+        comparable_data = self.payment._comparable_data  # pylint: disable=protected-access
+        self.assertIs(type(comparable_data), dict)
+        self.assertEqual(list(comparable_data.items()), [('amount', 10), ('description', 'Groceries')])
+
+    def test_comparison_with_other_types(self):
+        """
+        Test comparison with other types
+
+        Comparing with non Comparable objects should defer to Python and evaluate as unequal.
+        """
+        self.assertIs(self.payment.__eq__(None), NotImplemented)
+        self.assertFalse(self.payment == None)  # pylint: disable=singleton-comparison
+        self.assertTrue(self.payment != 'Groceries')
+        self.assertIn(self.payment, [None, 'Groceries', Payment(dict(self.data))])
+
+    def test_identity_compares_equal(self):
+        """
+        Test identity
+
+        An instance should be equal to itself.
+        """
+        self.assertTrue(self.payment == self.payment)  # pylint: disable=comparison-with-itself
+        self.assertFalse(self.payment != self.payment)  # pylint: disable=comparison-with-itself
+
+    def test_different_classes_compare_unequal(self):
+        """
+        Test different implementations
+
+        Instances of different implementations with the same data should not be equal.
+        """
+        self.assertNotEqual(self.payment, Refund(dict(self.data)))
+
+    def test_same_named_classes_from_different_modules_compare_unequal(self):
+        """
+        Test same named implementations
+
+        Implementations with the same name living in different modules should not be equal.
+        """
+        first_bank_transaction = get_provider_transaction('firstbank')
+        second_bank_transaction = get_provider_transaction('secondbank')
+        self.assertEqual(first_bank_transaction.__name__, second_bank_transaction.__name__)
+        self.assertNotEqual(first_bank_transaction(dict(self.data)), second_bank_transaction(dict(self.data)))
+        self.assertEqual(first_bank_transaction(dict(self.data)), first_bank_transaction(dict(self.data)))
@@ -34,6 +34,8 @@ Import all parts from ynabinterfaceslib here
 from ._version import __version__
 from .ynabinterfaceslib import Comparable, Contract, Transaction
 
+__all__ = ['Comparable', 'Contract', 'Transaction', '__version__']
+
 
 __author__ = '''Costas Tyfoxylos <costas.tyf@gmail.com>'''
 __docformat__ = '''google'''
@@ -43,9 +45,3 @@ __license__ = '''MIT'''
 __maintainer__ = '''Costas Tyfoxylos'''
 __email__ = '''<costas.tyf@gmail.com>'''
 __status__ = '''Development'''  # "Prototype", "Development", "Production".
-
-# This is to 'use' the module(s), so lint doesn't complain
-assert __version__
-assert Contract
-assert Comparable
-assert Transaction
@@ -33,7 +33,8 @@ Main code for ynabinterfaceslib.
 
 import abc
 import logging
-from collections import OrderedDict
+from hashlib import blake2b
+from operator import attrgetter
 
 __author__ = '''Costas Tyfoxylos <costas.tyf@gmail.com>'''
 __docformat__ = '''google'''
@@ -52,39 +53,84 @@ LOGGER = logging.getLogger(LOGGER_BASENAME)
 LOGGER.addHandler(logging.NullHandler())
 
 
+def _get_attributes_getter(names):
+    """Creates an attrgetter for the provided names that always returns a tuple."""
+    if len(names) == 1:
+        getter = attrgetter(names[0])
+        return lambda obj: (getter(obj),)
+    return attrgetter(*names)
+
+
 class Comparable(abc.ABC):
-    """Interface for something that can be comparable based on a _data internal attribute."""
+    """Interface for something that can be comparable based on a _data internal attribute.
+
+    Implementations declare the names of the attributes to compare on as a class level tuple in
+    _comparable_attributes and those attributes should be derived from _data. The hash is calculated
+    once and cached and is only reset when _data is reassigned, so changing _data in place is not
+    detected and leaves equality stale; reassign _data instead. The hash includes the module and
+    class name of the implementation.
+    """
+
+    __slots__ = ('_logger', '_raw_data', '_cached_hash')
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        attributes = getattr(cls, '_comparable_attributes', None)
+        if attributes is None:
+            return
+        if not isinstance(attributes, tuple) or not attributes:
+            raise TypeError(f'{cls.__name__}._comparable_attributes should be a non empty tuple of attribute names, '
+                            f'got {attributes!r}')
+        cls._attributes_getter = staticmethod(_get_attributes_getter(cls._comparable_attributes))
+        cls._hash_prefix = f'{cls.__module__}.{cls.__qualname__}'.encode() + b'\x00'
 
     def __init__(self, data):
         self._logger = logging.getLogger(f'{LOGGER_BASENAME}.{self.__class__.__name__}')
         self._data = data
 
     @property
-    def _comparable_attributes(self):
-        pass
+    def _data(self):
+        return self._raw_data
+
+    @_data.setter
+    def _data(self, value):
+        self._raw_data = value
+        self._cached_hash = None
 
     @property
     def _comparable_data(self):
-        return OrderedDict({key: getattr(self, key) for key in self._comparable_attributes})
+        return dict(zip(self._comparable_attributes, self._attributes_getter(self)))
 
     def __hash__(self):
-        return hash(str(self._comparable_data))
+        if getattr(self, '_cached_hash', None) is None:
+            if getattr(self, '_comparable_attributes', None) is None:
+                raise TypeError(f'{self.__class__.__name__} does not define _comparable_attributes')
+            buffer = bytearray(self._hash_prefix)
+            for key, value in zip(self._comparable_attributes, self._attributes_getter(self)):
+                buffer += key.encode()
+                buffer += b'\x00'
+                buffer += repr(value).encode()
+                buffer += b'\x01'
+            digest = blake2b(buffer, digest_size=8).digest()
+            self._cached_hash = int.from_bytes(digest, 'big', signed=True)
+        return self._cached_hash
 
     def __eq__(self, other):
         """Override the default equals behavior."""
+        if self is other:
+            return True
         if not isinstance(other, Comparable):
-            raise ValueError('Not a Comparable object')
+            return NotImplemented
         return hash(self) == hash(other)
 
-    def __ne__(self, other):
-        """Override the default unequal behavior."""
-        if not isinstance(other, Comparable):
-            raise ValueError('Not a Comparable object')
-        return hash(self) != hash(other)
-
 
 class Transaction(Comparable):  # pylint: disable=too-few-public-methods
-    """Interface for a transaction object."""
+    """Interface for a transaction object.
+
+    Implementations should declare their own __slots__, otherwise their instances carry a __dict__.
+    """
+
+    __slots__ = ()
 
     @staticmethod
     def _clean_up(string):